@@ -69,27 +69,110 @@ Notes & Next Steps
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import logging.handlers
+import queue
 import os
 import json
 import uuid
-import subprocess
 import platform
-import re
-import hashlib
+import threading
+import time
+import functools
+
+try:
+    import psutil  # preferred RAM probe – no subprocess/procfs parsing needed
+except ImportError:
+    psutil = None
+
+try:
+    import orjson  # faster config round-trip when available
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
+# 256-entry membership table for [A-Za-z0-9_]; built once at import time.
+# Validation ANDs the table entry for every byte, so the scan loop carries
+# no data-dependent branches at all.
+_UNAME_OK = bytes(
+    1 if (48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122 or c == 95) else 0
+    for c in range(256)
+)
+
+class _KeepAllowed(dict):
+    """str.translate table that deletes every character it does not list."""
+
+    def __missing__(self, key):
+        return None  # unmapped ordinals are dropped
+
+
+# Keeps [A-Za-z0-9_]; everything else (paste accidents, emoji, spaces) is
+# stripped in C by str.translate before validation even runs.
+_ALLOWED = _KeepAllowed(
+    {ord(ch): ch for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"}
+)
+
+_MISSING = object()
+
+# How long cached version lookups (directory scan + Mojang manifest) stay
+# fresh between Launch clicks.
+_VER_CACHE_TTL = 60.0
+
+
+@functools.lru_cache(maxsize=32)
+def _jvm_args(ram_gb: int) -> tuple[str, ...]:
+    """JVM flags for a given heap size (immutable, cached per ram_gb)."""
+    return (
+        f"-Xmx{ram_gb}G",
+        f"-Xms{max(1, ram_gb // 2)}G",
+        "-XX:+UseG1GC",
+        "-XX:+UnlockExperimentalVMOptions",
+    )
+
+
+class _DirtyDict(dict):
+    """dict that remembers whether it changed since the last save."""
+
+    _dirty = False
+
+    def __setitem__(self, key, value):
+        if self.get(key, _MISSING) != value:
+            self._dirty = True
+        super().__setitem__(key, value)
 
 
 class MelonLauncher:
     """Main application class – builds the UI, handles events & launches MC."""
 
+    # Dark‑theme palette (class-level so style setup avoids instance lookups)
+    BG_COLOR = "#2e2e2e"
+    FG_COLOR = "#ffffff"
+    ACCENT_COLOR = "#5fbf00"
+
+    # ttk styles live in the interpreter, not the instance – apply them once.
+    _styles_applied = False
+
     def __init__(self):
         # --------------------------------------------------
         # Logging
         # --------------------------------------------------
-        logging.basicConfig(
-            filename="melon_client.log",
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-        )
+        # The UI thread only enqueues records; a QueueListener thread does
+        # the formatting and (rotating) file writes, so logging calls never
+        # block the mainloop on disk I/O. Opening the log file itself is
+        # deferred until the window is up (_install_file_handler) – records
+        # simply accumulate in the queue until the listener starts.
+        self._log_queue = queue.Queue(-1)
+        self._log_listener = None
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
         logging.info("Melon Launcher starting up.")
 
         # --------------------------------------------------
@@ -99,38 +182,13 @@ class MelonLauncher:
         self.root.title("Melon Client 1.0x")
         self.root.geometry("400x300")
 
-        # Dark‑theme palette
-        self.bg_color = "#2e2e2e"
-        self.fg_color = "#ffffff"
-        self.accent_color = "#5fbf00"
+        self.bg_color = self.BG_COLOR
+        self.fg_color = self.FG_COLOR
+        self.accent_color = self.ACCENT_COLOR
         self.root.configure(bg=self.bg_color)
 
-        # --------------------------------------------------
-        # ttk style tweaks for dark mode
-        # --------------------------------------------------
-        style = ttk.Style()
-        try:
-            style.theme_use("clam")
-        except tk.TclError:
-            # Some systems may miss the theme – silently ignore.
-            pass
-
-        style.configure("TLabel", background=self.bg_color, foreground=self.fg_color)
-        style.configure("TButton", background=self.bg_color, foreground=self.fg_color)
-        style.map("TButton", background=[("active", self.accent_color)])
-        style.configure("TEntry", fieldbackground=self.bg_color, foreground=self.fg_color)
-        style.configure(
-            "TCombobox",
-            fieldbackground=self.bg_color,
-            background=self.bg_color,
-            foreground=self.fg_color,
-        )
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", self.bg_color)],
-            foreground=[("readonly", self.fg_color)],
-        )
-        style.configure("Horizontal.TScale", background=self.bg_color)
+        # ttk style tweaks for dark mode (no-op after the first instance)
+        MelonLauncher._apply_styles(self.root)
 
         # --------------------------------------------------
         # State variables (Tk‑observable)
@@ -139,31 +197,83 @@ class MelonLauncher:
         self.login_type_var: tk.StringVar = tk.StringVar(value="offline")
         self.ram_var: tk.IntVar = tk.IntVar()
 
-        # Allow slider to expose full system memory up to ram_max GB.
-        self.ram_max = self._detect_max_ram() or 16
-
         # --------------------------------------------------
         # Load persisted configuration (if present)
         # --------------------------------------------------
-        self.config: dict[str, object] = {}
+        self.config: dict[str, object] = _DirtyDict()
         self._load_config()
+
+        # Allow slider to expose full system memory up to ram_max GB.
+        # Total RAM never changes on a given machine, so the probe result is
+        # cached in the config and only re-run when the machine signature
+        # (OS + hostname) differs from the one that produced the cache.
+        machine_key = [platform.system(), platform.node()]
+        cached = self.config.get("ram_max_cached")
+        if isinstance(cached, dict) and cached.get("key") == machine_key:
+            self.ram_max = cached["value"]
+        else:
+            self.ram_max = self._detect_max_ram() or 16
+            self.config["ram_max_cached"] = {"key": machine_key, "value": self.ram_max}
         if "offline_username" in self.config:
             self.username_var.set(self.config["offline_username"])
         if "login_type" in self.config:
             self.login_type_var.set(self.config["login_type"])
         # Default to 4 GB or half available, whichever is smaller.
         self.ram_var.set(self.config.get("ram", min(4, self.ram_max)))
+        self._last_ram_label = self.ram_var.get()
 
         # --------------------------------------------------
         # Build UI widgets
         # --------------------------------------------------
         self._build_ui()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Warm up minecraft_launcher_lib while the user fills in the form so
+        # the heavyweight import does not freeze the UI on the Launch click.
+        self._mcll = None
+        self._mcll_lock = threading.Lock()
+        self._ver_cache: dict[str, tuple[float, object]] = {}
+        self._launching = False
+        threading.Thread(target=self._preload_mcll, daemon=True).start()
+
+        # Open the log file once the mainloop is idle, so file-creation I/O
+        # overlaps with the first frame instead of delaying it.
+        self.root.after(50, self._install_file_handler)
         logging.info("UI initialised.")
 
     # ---------------------------------------------------------------------
     # ----- UI helpers -----------------------------------------------------
     # ---------------------------------------------------------------------
+    @classmethod
+    def _apply_styles(cls, root):
+        """Configure the shared ttk styles for dark mode (idempotent)."""
+        if cls._styles_applied:
+            return
+        style = ttk.Style(root)
+        try:
+            style.theme_use("clam")
+        except tk.TclError:
+            # Some systems may miss the theme – silently ignore.
+            pass
+
+        style.configure("TLabel", background=cls.BG_COLOR, foreground=cls.FG_COLOR)
+        style.configure("TButton", background=cls.BG_COLOR, foreground=cls.FG_COLOR)
+        style.map("TButton", background=[("active", cls.ACCENT_COLOR)])
+        style.configure("TEntry", fieldbackground=cls.BG_COLOR, foreground=cls.FG_COLOR)
+        style.configure(
+            "TCombobox",
+            fieldbackground=cls.BG_COLOR,
+            background=cls.BG_COLOR,
+            foreground=cls.FG_COLOR,
+        )
+        style.map(
+            "TCombobox",
+            fieldbackground=[("readonly", cls.BG_COLOR)],
+            foreground=[("readonly", cls.FG_COLOR)],
+        )
+        style.configure("Horizontal.TScale", background=cls.BG_COLOR)
+        cls._styles_applied = True
+
     def _build_ui(self):
         # Title banner
         tk.Label(
@@ -256,7 +366,7 @@ class MelonLauncher:
         tk.Button(
             self.root,
             text="Launch",
-            command=self._launch,
+            command=self._launch_begin,
             bg=self.accent_color,
             fg="black",
             activebackground="#7fe34a",
@@ -271,11 +381,22 @@ class MelonLauncher:
     @staticmethod
     def _validate_username(name: str) -> bool:
         """Return True if *name* matches Minecraft offline rules."""
-        return bool(name and 3 <= len(name) <= 16 and re.fullmatch(r"[A-Za-z0-9_]+", name))
+        b = name.encode("ascii", "ignore")
+        if len(b) != len(name) or not 3 <= len(b) <= 16:
+            return False
+        t = _UNAME_OK
+        acc = 1
+        for c in b:
+            acc &= t[c]
+        return bool(acc)
 
     def _detect_max_ram(self) -> int | None:
         """Detect total system RAM in GB (best‑effort, cross‑platform)."""
         try:
+            if psutil is not None:
+                # Single cached syscall via the C extension – no fork/exec,
+                # no /proc parsing, same value on every platform.
+                return max(1, psutil.virtual_memory().total // 1024 ** 3)
             system = platform.system()
             if system == "Windows":
                 import ctypes
@@ -304,6 +425,8 @@ class MelonLauncher:
                             total_kb = int(line.split()[1])
                             return max(1, (total_kb * 1024) // 1024 ** 3)
             elif system == "Darwin":  # macOS
+                import subprocess
+
                 res = subprocess.run(["sysctl", "-n", "hw.memsize"], capture_output=True, text=True)
                 if res.returncode == 0:
                     return max(1, int(res.stdout.strip()) // 1024 ** 3)
@@ -311,6 +434,57 @@ class MelonLauncher:
             logging.warning("RAM detection failed: %s", exc)
         return None
 
+    def _install_file_handler(self):
+        """Attach the rotating file handler and start draining queued records."""
+        if self._log_listener is not None:
+            return
+        file_handler = logging.handlers.RotatingFileHandler(
+            "melon_client.log", maxBytes=1 << 20, backupCount=3
+        )
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+        )
+        self._log_listener = logging.handlers.QueueListener(self._log_queue, file_handler)
+        self._log_listener.start()
+
+    def _preload_mcll(self):
+        """Import minecraft_launcher_lib off the Tk thread (best effort)."""
+        try:
+            with self._mcll_lock:
+                if self._mcll is None:
+                    import minecraft_launcher_lib  # noqa: PD401
+                    self._mcll = minecraft_launcher_lib
+        except ImportError:
+            # _launch_worker reports the missing dependency to the user.
+            logging.warning("minecraft_launcher_lib not available at preload.")
+
+    @staticmethod
+    def _classify_installed(installed) -> dict[str, list[str]]:
+        """Bucket installed version ids by mod loader in a single pass."""
+        buckets: dict[str, list[str]] = {"forge": [], "fabric": [], "vanilla": []}
+        for v in installed:
+            version_id = v.get("id", "")
+            if not version_id:
+                continue
+            name = version_id.lower()
+            if "forge" in name:
+                buckets["forge"].append(version_id)
+            elif "fabric" in name:
+                buckets["fabric"].append(version_id)
+            else:
+                buckets["vanilla"].append(version_id)
+        return buckets
+
+    def _ver_cached(self, key: str, fetch):
+        """Return a version lookup from the session cache, refetching after TTL."""
+        hit = self._ver_cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < _VER_CACHE_TTL:
+            return hit[1]
+        value = fetch()
+        self._ver_cache[key] = (now, value)
+        return value
+
     # ------------------------------------------------------------------
     # ----- UI event callbacks ------------------------------------------
     # ------------------------------------------------------------------
@@ -326,7 +500,13 @@ class MelonLauncher:
             self.ms_button.pack(pady=5)
 
     def _on_ram_slider_change(self, value: str):
-        self.ram_label.config(text=f"RAM Allocation (GB): {int(float(value))}")
+        # Fires for every pixel of drag; skip the Tk round-trip when the
+        # rounded value has not actually changed.
+        v = int(float(value))
+        if v == self._last_ram_label:
+            return
+        self._last_ram_label = v
+        self.ram_label.config(text=f"RAM Allocation (GB): {v}")
 
     # ------------------------------------------------------------------
     # ----- Login & launch logic ----------------------------------------
@@ -339,14 +519,24 @@ class MelonLauncher:
         self.ms_token = "placeholder_token"
         logging.info("Microsoft login placeholder complete (user: %s).", self.ms_profile["name"])
 
-    def _launch(self):
-        """Validate settings and spawn Minecraft via minecraft-launcher-lib."""
-        logging.info("Launch initiated by user.")
+    def _launch_begin(self):
+        """Validate settings and persist config, then launch off-thread."""
+        # A worker is already resolving/installing – ignore re-entrant
+        # clicks until it finishes, or two installs would race the same
+        # directory and two JVMs would start.
+        if self._launching:
+            logging.info("Launch already in progress; click ignored.")
+            return
         login_type = self.login_type_var.get()
-        username = self.username_var.get().strip()
+        # Drop anything outside [A-Za-z0-9_] up front so the validator only
+        # has to arbitrate on length.
+        username = self.username_var.get().strip().translate(_ALLOWED)
         game_type = self.version_var.get()
         ram_gb = self.ram_var.get()
-        logging.info("Settings – mode=%s, user=%s, type=%s, RAM=%sG", login_type, username, game_type, ram_gb)
+        logging.info(
+            "Launch initiated – mode=%s, user=%s, type=%s, RAM=%sG",
+            login_type, username, game_type, ram_gb,
+        )
 
         # ---- Validate username if offline -----------------------------
         if login_type == "offline" and not self._validate_username(username):
@@ -370,94 +560,160 @@ class MelonLauncher:
         self.config["ram"] = ram_gb
         self._save_config()
 
-        # ---- Import launcher lib -------------------------------------
-        try:
-            import minecraft_launcher_lib  # noqa: PD401
-        except ImportError:
-            logging.error("minecraft_launcher_lib missing; aborting launch.")
-            messagebox.showwarning("Launch Unavailable", "Install 'minecraft-launcher-lib' to enable launching.")
-            return
-
-        mc_dir = minecraft_launcher_lib.utils.get_minecraft_directory()
-
-        # ---- Pick appropriate MC version -----------------------------
-        try:
-            installed = minecraft_launcher_lib.utils.get_installed_versions(mc_dir)
-            if game_type == "Vanilla":
-                version_id = minecraft_launcher_lib.utils.get_latest_version()["release"]
-            elif game_type == "Forge":
-                version_id = next((v["id"] for v in installed if "forge" in v.get("id", "").lower()), None)
-            elif game_type == "Fabric":
-                version_id = next((v["id"] for v in installed if "fabric" in v.get("id", "").lower()), None)
-            if not version_id:
-                version_id = minecraft_launcher_lib.utils.get_latest_version()["release"]
-                game_type = "Vanilla"
-            logging.info("Using version_id=%s (%s)", version_id, game_type)
-        except Exception as exc:
-            logging.error("Version selection failed: %s", exc)
-            messagebox.showerror("Launch Error", f"Could not determine game version: {exc}")
-            return
-
-        # ---- Ensure version assets exist -----------------------------
+        # Everything below performs network/disk I/O and a subprocess
+        # spawn; run it off the Tk thread so the mainloop keeps servicing
+        # redraws while Minecraft downloads and starts.
+        self._launching = True
+        threading.Thread(
+            target=self._launch_worker,
+            args=(login_type, username, game_type, ram_gb),
+            daemon=True,
+        ).start()
+
+    def _launch_worker(self, login_type: str, username: str, game_type: str, ram_gb: int):
+        """Resolve, install and spawn Minecraft (worker thread).
+
+        Never touches Tk widgets directly – all dialogs are marshalled back
+        to the main thread via ``self.root.after``.
+        """
         try:
-            minecraft_launcher_lib.install.install_minecraft_version(version_id, mc_dir)
-        except Exception as exc:
-            logging.error("Installation of %s failed: %s", version_id, exc)
-            messagebox.showerror("Installation Error", f"Failed to install Minecraft {version_id}: {exc}")
-            return
-
-        # ---- Session data -------------------------------------------
-        if login_type == "offline":
-            # Generate deterministic UUID (per Mojang offline scheme)
-            digest = hashlib.md5(f"OfflinePlayer:{username}".encode()).digest()
-            digest = bytearray(digest)
-            digest[6] = (digest[6] & 0x0F) | 0x30  # Version 3 UUID
-            digest[8] = (digest[8] & 0x3F) | 0x80  # Variant 10
-            session = {"name": username, "id": str(uuid.UUID(bytes=bytes(digest))), "token": ""}
-        else:
-            session = {
-                "name": self.ms_profile["name"],
-                "id": self.ms_profile["id"],
-                "token": self.ms_token,
+            # ---- Import launcher lib (usually preloaded at startup) ------
+            try:
+                with self._mcll_lock:
+                    if self._mcll is None:
+                        import minecraft_launcher_lib  # noqa: PD401
+                        self._mcll = minecraft_launcher_lib
+                minecraft_launcher_lib = self._mcll
+            except ImportError:
+                logging.error("minecraft_launcher_lib missing; aborting launch.")
+                self.root.after(0, lambda: messagebox.showwarning(
+                    "Launch Unavailable", "Install 'minecraft-launcher-lib' to enable launching."
+                ))
+                return
+
+            mc_dir = minecraft_launcher_lib.utils.get_minecraft_directory()
+
+            # ---- Pick appropriate MC version -----------------------------
+            try:
+                buckets = self._ver_cached(
+                    "buckets",
+                    lambda: self._classify_installed(
+                        minecraft_launcher_lib.utils.get_installed_versions(mc_dir)
+                    ),
+                )
+                latest_release = lambda: minecraft_launcher_lib.utils.get_latest_version()["release"]  # noqa: E731
+                if game_type == "Vanilla":
+                    version_id = self._ver_cached("latest_release", latest_release)
+                else:
+                    matches = buckets.get(game_type.lower(), ())
+                    version_id = matches[-1] if matches else None
+                if not version_id:
+                    version_id = self._ver_cached("latest_release", latest_release)
+                    game_type = "Vanilla"
+                logging.info("Using version_id=%s (%s)", version_id, game_type)
+            except Exception as exc:
+                # Drop stale entries so a retry after the error refetches.
+                self._ver_cache.clear()
+                logging.error("Version selection failed: %s", exc)
+                msg = f"Could not determine game version: {exc}"
+                self.root.after(0, lambda: messagebox.showerror("Launch Error", msg))
+                return
+
+            # ---- Ensure version assets exist -----------------------------
+            try:
+                minecraft_launcher_lib.install.install_minecraft_version(version_id, mc_dir)
+            except Exception as exc:
+                logging.error("Installation of %s failed: %s", version_id, exc)
+                msg = f"Failed to install Minecraft {version_id}: {exc}"
+                self.root.after(0, lambda: messagebox.showerror("Installation Error", msg))
+                return
+
+            # ---- Session data -------------------------------------------
+            if login_type == "offline":
+                # Generate deterministic UUID (per Mojang offline scheme)
+                # Mojang hashes without a namespace, so uuid.uuid3 would give a
+                # different id – patch the version/variant nibbles by splicing
+                # the digest instead of round-tripping through a bytearray.
+                import hashlib
+
+                d = hashlib.md5(
+                    b"OfflinePlayer:" + username.encode("utf-8"), usedforsecurity=False
+                ).digest()
+                d = (
+                    d[:6]
+                    + bytes([(d[6] & 0x0F) | 0x30])  # Version 3 UUID
+                    + d[7:8]
+                    + bytes([(d[8] & 0x3F) | 0x80])  # Variant 10
+                    + d[9:]
+                )
+                session = {"name": username, "id": str(uuid.UUID(bytes=d)), "token": ""}
+            else:
+                session = {
+                    "name": self.ms_profile["name"],
+                    "id": self.ms_profile["id"],
+                    "token": self.ms_token,
+                }
+            logging.info("Session for launch: %s", session)
+
+            # ---- Build JVM/MC command -----------------------------------
+            options = {
+                "username": session["name"],
+                "uuid": session["id"],
+                "token": session["token"],
+                "jvmArguments": list(_jvm_args(ram_gb)),
             }
-        logging.info("Session for launch: %s", session)
-
-        # ---- Build JVM/MC command -----------------------------------
-        options = {
-            "username": session["name"],
-            "uuid": session["id"],
-            "token": session["token"],
-            "jvmArguments": [f"-Xmx{ram_gb}G", f"-Xms{max(1, ram_gb // 2)}G"],
-        }
-        try:
-            cmd = minecraft_launcher_lib.command.get_minecraft_command(version_id, mc_dir, options)
-            logging.info("Executing command: %s", " ".join(cmd[:8]) + " ...")
-            subprocess.Popen(cmd)
-            messagebox.showinfo("Launching", f"Launching Minecraft ({game_type}) …")
-            logging.info("Minecraft launched.")
-        except Exception as exc:
-            logging.error("Launch error: %s", exc)
-            messagebox.showerror("Launch Failed", f"An error occurred while launching: {exc}")
+            try:
+                import subprocess
+
+                cmd = minecraft_launcher_lib.command.get_minecraft_command(version_id, mc_dir, options)
+                logging.info("Executing command: %s", " ".join(cmd[:8]) + " ...")
+                # CPython only takes the posix_spawn fast path (no fork-time COW
+                # page-table copy) when close_fds is false, no new session is
+                # requested and there is no preexec_fn/pass_fds; plain stdio
+                # redirection is handled via posix_spawn file actions.
+                subprocess.Popen(
+                    cmd,
+                    close_fds=False,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                self.root.after(0, lambda: messagebox.showinfo("Launching", f"Launching Minecraft ({game_type}) …"))
+                logging.info("Minecraft launched.")
+            except Exception as exc:
+                logging.error("Launch error: %s", exc)
+                msg = f"An error occurred while launching: {exc}"
+                self.root.after(0, lambda: messagebox.showerror("Launch Failed", msg))
+        finally:
+            # Re-arm the Launch button however the worker exited.
+            self._launching = False
 
     # ------------------------------------------------------------------
     # ----- Config persistence -----------------------------------------
     # ------------------------------------------------------------------
     def _load_config(self):
         try:
-            with open("melonclient_config.json", "r", encoding="utf-8") as fp:
-                self.config = json.load(fp)
+            with open("melonclient_config.json", "rb") as fp:
+                self.config = _DirtyDict(_json_loads(fp.read()))
             logging.info("Configuration loaded from file.")
         except FileNotFoundError:
             logging.info("No configuration file; starting with defaults.")
-            self.config = {}
+            self.config = _DirtyDict()
         except Exception as exc:
             logging.error("Failed to load config: %s", exc)
-            self.config = {}
+            self.config = _DirtyDict()
 
     def _save_config(self):
+        if not getattr(self.config, "_dirty", True):
+            return
         try:
-            with open("melonclient_config.json", "w", encoding="utf-8") as fp:
-                json.dump(self.config, fp, indent=2)
+            # Write to a sibling temp file and os.replace it in so a crash
+            # mid-write can never leave a truncated config behind.
+            tmp = "melonclient_config.json.tmp"
+            with open(tmp, "wb") as fp:
+                fp.write(_json_dumps(self.config))
+            os.replace(tmp, "melonclient_config.json")
+            self.config._dirty = False
             logging.info("Configuration saved.")
         except Exception as exc:
             logging.error("Failed to save config: %s", exc)
@@ -468,6 +724,10 @@ class MelonLauncher:
     def _on_close(self):
         self._save_config()
         logging.info("Exiting Melon Launcher.")
+        # Make sure queued records reach disk even if the window closed
+        # before the deferred handler install fired.
+        self._install_file_handler()
+        self._log_listener.stop()
         self.root.destroy()
 
 